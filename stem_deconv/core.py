@@ -1,5 +1,5 @@
 import numpy as np
-from .utils import fft2, ifft2, fftshift, ifftshift
+from .utils import rfft2, irfft2, fftshift
 from .regularization import total_variation_gradient, tikhonov_miller_regularization
 
 def richardson_lucy_additive(image, probe, iterations, lambda_reg=0, reg_type="None", alpha=1.0, boundary_handling=False):
@@ -41,9 +41,14 @@ def richardson_lucy_additive(image, probe, iterations, lambda_reg=0, reg_type="N
     
     # FFTs
     # C++ uses FFTW_FORWARD (unnormalized).
-    # We use scipy.fft.fft2 (unnormalized).
-    probe_fft = fft2(probe_spatial)
-    probe_flip_fft = fft2(probe_flip_spatial)
+    # We use scipy.fft.rfft2 (unnormalized); everything convolved here is
+    # real, so the half-plane spectrum is enough.
+    # The probe is centred, so every convolution result needs an fftshift;
+    # fftshift(x conv p) == x conv fftshift(p), so the shift is folded into
+    # the OTFs once instead of copying each result.
+    probe_fft = rfft2(fftshift(probe_spatial))
+    probe_flip_fft = rfft2(fftshift(probe_flip_spatial))
+    shape = object_data.shape
     
     # Scale factor for IFFT
     # C++ does IFFT (unnormalized) then Scale(1/N).
@@ -52,18 +57,18 @@ def richardson_lucy_additive(image, probe, iterations, lambda_reg=0, reg_type="N
     
     for i in range(iterations):
         # 1. Convolve Object with Probe: O * P
-        obj_fft = fft2(object_data)
+        obj_fft = rfft2(object_data)
         blurred_fft = obj_fft * probe_fft
-        blurred = np.real(fftshift(ifft2(blurred_fft)))
+        blurred = irfft2(blurred_fft, s=shape)
         
         # 2. Calculate Ratio: I / (O * P)
         denom = np.maximum(blurred, 1e-9)
         ratio = image / denom
         
         # 3. Convolve Ratio with Flipped Probe: Ratio * P_flip
-        ratio_fft = fft2(ratio)
+        ratio_fft = rfft2(ratio)
         gradient_fft = ratio_fft * probe_flip_fft
-        gradient = np.real(fftshift(ifft2(gradient_fft)))
+        gradient = irfft2(gradient_fft, s=shape)
         
         # 4. Update Step
         # C++: tempImage = gradient
@@ -107,7 +112,36 @@ def richardson_lucy_additive(image, probe, iterations, lambda_reg=0, reg_type="N
 
     return object_data
 
-def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_type="None", pixel_size=1.0, wavelength=1.0, acceleration=False, boundary_handling=False, damping_threshold=None, background_level=0.0):
+def probe_otf(probe, boundary_handling=False):
+    """
+    OTFs of the normalized probe and of its flip, as used by
+    richardson_lucy_multiplicative.
+    Compute once and pass as precomputed_otf to reuse them across calls with
+    the same probe and boundary_handling.
+    
+    Returns:
+        tuple: (probe_fft, probe_flip_fft) in rfft2 layout.
+    """
+    # Zero-padded like the image in boundary handling
+    if boundary_handling:
+        pad_y = probe.shape[0] // 8
+        pad_x = probe.shape[1] // 8
+        probe = np.pad(probe, ((pad_y, pad_y), (pad_x, pad_x)), mode='constant')
+    
+    probe_spatial = np.abs(probe).astype(np.float32)
+    
+    # Normalize probe to preserve energy (sum = 1)
+    # This is critical for Richardson-Lucy, especially with background modeling
+    probe_sum = np.sum(probe_spatial)
+    if probe_sum != 0:
+        probe_spatial /= probe_sum
+    
+    probe_flip_spatial = np.roll(np.flip(np.flip(probe_spatial, 0), 1), (1, 1), (0, 1))
+    
+    # OTFs of the fftshifted (centred) probe: results come out unshifted
+    return rfft2(fftshift(probe_spatial)), rfft2(fftshift(probe_flip_spatial))
+
+def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_type="None", pixel_size=1.0, wavelength=1.0, acceleration=False, boundary_handling=False, damping_threshold=None, background_level=0.0, precomputed_otf=None):
     """
     Richardson-Lucy Multiplicative Deconvolution.
     Supports Biggs-Andrews acceleration, Damping, and Background handling.
@@ -117,28 +151,22 @@ def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_t
                                    If set, suppresses noise amplification in flat regions.
         background_level (float): Estimated background level to subtract/model during deconvolution.
                                   RL assumes Poisson noise on (Signal + Background).
+        precomputed_otf (tuple): probe_otf(probe, boundary_handling) from an earlier
+                                 call; skips the probe FFTs. probe is then unused.
     """
-    # Boundary Handling: Pad image and probe
+    # Boundary Handling: Pad image (the probe is padded by probe_otf)
     if boundary_handling:
         pad_y = image.shape[0] // 8
         pad_x = image.shape[1] // 8
         pad_width = ((pad_y, pad_y), (pad_x, pad_x))
         image = np.pad(image, pad_width, mode='reflect')
-        probe = np.pad(probe, pad_width, mode='constant')
 
     object_data = image.astype(np.float32)
-    probe_spatial = np.abs(probe).astype(np.float32)
-    
-    # Normalize probe to preserve energy (sum = 1)
-    # This is critical for Richardson-Lucy, especially with background modeling
-    probe_sum = np.sum(probe_spatial)
-    if probe_sum != 0:
-        probe_spatial /= probe_sum
     
-    probe_flip_spatial = np.roll(np.flip(np.flip(probe_spatial, 0), 1), (1, 1), (0, 1))
-    
-    probe_fft = fft2(probe_spatial)
-    probe_flip_fft = fft2(probe_flip_spatial)
+    if precomputed_otf is None:
+        precomputed_otf = probe_otf(probe, boundary_handling)
+    probe_fft, probe_flip_fft = precomputed_otf
+    shape = object_data.shape
     
     # Acceleration variables
     if acceleration:
@@ -146,6 +174,9 @@ def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_t
         g_tm2 = object_data.copy()
         alpha_acc = 0.0
 
+    # Reused across iterations by the TM regularizer
+    tm_term = None
+
     for i in range(iterations):
         # Prediction step for acceleration
         if acceleration and i > 1:
@@ -158,8 +189,8 @@ def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_t
             current_estimate = object_data
 
         # 1. O * P + Background
-        obj_fft = fft2(current_estimate)
-        blurred = np.real(fftshift(ifft2(obj_fft * probe_fft)))
+        obj_fft = rfft2(current_estimate)
+        blurred = irfft2(obj_fft * probe_fft, s=shape)
         
         # Add background to the model prediction
         blurred_with_bg = blurred + background_level
@@ -186,7 +217,7 @@ def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_t
             ratio[mask_damp] = 1.0
         
         # 3. Ratio * P_flip
-        gradient = np.real(fftshift(ifft2(fft2(ratio) * probe_flip_fft)))
+        gradient = irfft2(rfft2(ratio) * probe_flip_fft, s=shape)
         
         # 4. Update
         if reg_type == "TV":
@@ -200,10 +231,10 @@ def richardson_lucy_multiplicative(image, probe, iterations, lambda_reg=0, reg_t
             
         elif reg_type == "TM":
             # Multiplicative TM
-            tm_term = tikhonov_miller_regularization(current_estimate, lambda_reg, pixel_size, wavelength)
-            divisor = tm_term
+            tm_term = tikhonov_miller_regularization(current_estimate, lambda_reg, pixel_size,
+                                                     wavelength, out=tm_term)
             # Ensure divisor is positive
-            divisor = np.maximum(divisor, 1e-6)
+            divisor = np.maximum(tm_term, 1e-6, out=tm_term)
             
             new_object = current_estimate * gradient / divisor
             
@@ -250,8 +281,10 @@ def fista_deconvolution(image, probe, iterations, lambda_reg=0.001, boundary_han
         
     probe_flip_spatial = np.roll(np.flip(np.flip(probe_spatial, 0), 1), (1, 1), (0, 1))
     
-    probe_fft = fft2(probe_spatial)
-    probe_flip_fft = fft2(probe_flip_spatial)
+    # OTFs of the fftshifted (centred) probe: results come out unshifted
+    probe_fft = rfft2(fftshift(probe_spatial))
+    probe_flip_fft = rfft2(fftshift(probe_flip_spatial))
+    shape = probe_spatial.shape
     
     # Lipschitz constant estimation (max eigenvalue of A^T A)
     # For convolution, it's max(|FFT(probe)|^2)
@@ -262,15 +295,15 @@ def fista_deconvolution(image, probe, iterations, lambda_reg=0.001, boundary_han
     for k in range(iterations):
         # Gradient descent step on data fidelity: x - step * A^T (Ax - b)
         # Ax
-        Ax_fft = fft2(y) * probe_fft
-        Ax = np.real(fftshift(ifft2(Ax_fft)))
+        Ax_fft = rfft2(y) * probe_fft
+        Ax = irfft2(Ax_fft, s=shape)
         
         # Residual Ax - b
         residual = Ax - image
         
         # A^T (Residual)
-        grad_fft = fft2(residual) * probe_flip_fft
-        grad = np.real(fftshift(ifft2(grad_fft)))
+        grad_fft = rfft2(residual) * probe_flip_fft
+        grad = irfft2(grad_fft, s=shape)
         
         x_next = y - step_size * grad
         
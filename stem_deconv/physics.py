@@ -1,13 +1,23 @@
+import math
+from functools import lru_cache
+
 import numpy as np
-from .utils import fft2, ifft2, fftshift, ifftshift
+from .utils import ifft2
+
+# numba is optional; without it calculate_ctf uses the numpy path
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
 def calculate_wavelength(voltage_kv):
     """
     Calculate relativistic electron wavelength in nm.
     Args:
-        voltage_kv (float): Acceleration voltage in kV.
+        voltage_kv (float or np.ndarray): Acceleration voltage in kV.
     Returns:
-        float: Wavelength in nm.
+        float or np.ndarray: Wavelength in nm (element-wise for arrays).
     """
     # Constants
     emass = 510.99906  # keV
@@ -19,6 +29,46 @@ def calculate_wavelength(voltage_kv):
     
     return wavelen_angstrom / 10.0  # Convert A to nm
 
+@lru_cache(maxsize=8)
+def _ctf_grid(ny, nx, pixel_size_A):
+    """
+    Frequency grid for calculate_ctf, cached on (ny, nx, pixel_size_A).
+    
+    Returns:
+        tuple: Read-only float32 (K2, K, PHI) arrays in standard FFT layout
+            (k^2 in 1/A^2, |k| in 1/A, azimuth in rad).
+    """
+    # float32 is ample at STEM tolerances and halves the memory traffic
+    ky = np.fft.fftfreq(ny, d=pixel_size_A).astype(np.float32)
+    kx = np.fft.fftfreq(nx, d=pixel_size_A).astype(np.float32)
+    KX, KY = np.meshgrid(kx, ky)
+    
+    K2 = KX**2 + KY**2 # k_square in 1/A^2
+    K = np.sqrt(K2)
+    
+    # Angle for astigmatism
+    # C++: ang = acos((kx*kx + k_square - ky*ky) / (2*kx*k)) which simplifies to atan2(ky, kx) logic
+    # but C++ handles quadrants manually. np.arctan2 is safer.
+    # Note: C++ code has `if (ky < 0.0) ang = -ang;`
+    PHI = np.arctan2(KY, KX)
+    
+    # Shared between calls, so callers must not modify them
+    for arr in (K2, K, PHI):
+        arr.flags.writeable = False
+    return K2, K, PHI
+
+@lru_cache(maxsize=8)
+def _wavelength_powers(voltage_kv):
+    """
+    Wavelength and its square and cube in Angstroms, cached on voltage.
+    
+    Returns:
+        tuple: (wal, wal2, wal3).
+    """
+    # Plain floats, so they do not promote float32 grids to float64
+    wal = float(calculate_wavelength(voltage_kv)) * 10.0
+    return wal, wal**2, wal**3
+
 def calculate_ctf(shape, pixel_size_nm, voltage_kv, 
                   cs3_mm, cs5_mm, defocus_nm, 
                   obj_aperture_rad, 
@@ -47,11 +97,68 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
         convergence_angle_rad (float): Convergence angle in rad.
         
     Returns:
-        np.ndarray: Complex CTF array.
+        np.ndarray: Complex CTF array (complex64).
+    """
+    return _calculate_ctf(shape, pixel_size_nm, voltage_kv,
+                          cs3_mm, cs5_mm, [defocus_nm],
+                          obj_aperture_rad,
+                          a2_amp_nm, a2_angle_rad,
+                          a3_amp_nm, a3_angle_rad,
+                          b2_amp_nm, b2_angle_rad,
+                          focal_spread_nm, convergence_angle_rad)[0]
+
+def calculate_ctf_stack(shape, pixel_size_nm, voltage_kv,
+                        cs3_mm, cs5_mm, defocus_nm_array,
+                        obj_aperture_rad,
+                        a2_amp_nm=0, a2_angle_rad=0,
+                        a3_amp_nm=0, a3_angle_rad=0,
+                        b2_amp_nm=0, b2_angle_rad=0,
+                        focal_spread_nm=0, convergence_angle_rad=0):
+    """
+    Calculate CTFs for a series of defocus values on the same grid.
+    
+    Equivalent to stacking calculate_ctf() over defocus_nm_array, but the
+    frequency grid and every defocus-independent term are computed once.
+    Takes the same arguments as calculate_ctf(), except:
+    
+    Args:
+        defocus_nm_array (array_like): 1D sequence of defocus values in nm.
+        
+    Returns:
+        np.ndarray: Complex CTF stack of shape (D, height, width) (complex64).
+            The probes can be computed in one call with
+            scipy.fft.ifft2(stack, axes=(-2, -1), workers=-1).
+    """
+    return _calculate_ctf(shape, pixel_size_nm, voltage_kv,
+                          cs3_mm, cs5_mm, defocus_nm_array,
+                          obj_aperture_rad,
+                          a2_amp_nm, a2_angle_rad,
+                          a3_amp_nm, a3_angle_rad,
+                          b2_amp_nm, b2_angle_rad,
+                          focal_spread_nm, convergence_angle_rad)
+
+def _calculate_ctf(shape, pixel_size_nm, voltage_kv,
+                   cs3_mm, cs5_mm, defocus_nm,
+                   obj_aperture_rad,
+                   a2_amp_nm, a2_angle_rad,
+                   a3_amp_nm, a3_angle_rad,
+                   b2_amp_nm, b2_angle_rad,
+                   focal_spread_nm, convergence_angle_rad):
     """
+    Shared implementation of calculate_ctf / calculate_ctf_stack.
+    
+    defocus_nm is a 1D sequence; returns a (D, ny, nx) complex64 stack.
+    Only the defocus term and the spatial envelope depend on defocus, so
+    the numpy path computes everything else once on the 2D grid and
+    broadcasts over the leading axis.
+    """
+    # (D, 1, 1) so the defocus-dependent scalars broadcast over the grid
+    defocus_nm = np.asarray(defocus_nm, dtype=np.float64).reshape(-1, 1, 1)
+    n_defocus = defocus_nm.shape[0]
+    
     ny, nx = shape
-    wavelength_nm = calculate_wavelength(voltage_kv)
-    wavelength_A = wavelength_nm * 10.0
+    wal, wal2, wal3 = _wavelength_powers(float(voltage_kv))
+    wavelength_A = wal
     
     # Frequency grid setup
     # C++: delta_kx = 1.0 / (pixelSize * nx) (in 1/A)
@@ -61,13 +168,6 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
     
     pixel_size_A = pixel_size_nm * 10.0
     
-    ky = np.fft.fftfreq(ny, d=pixel_size_A)
-    kx = np.fft.fftfreq(nx, d=pixel_size_A)
-    KX, KY = np.meshgrid(kx, ky)
-    
-    K2 = KX**2 + KY**2 # k_square in 1/A^2
-    K = np.sqrt(K2)
-    
     # Aperture cutoff
     # kmax = alpha / lambda
     if obj_aperture_rad > 0.0001:
@@ -75,12 +175,6 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
         kmax2 = kmax**2
     else:
         kmax2 = 1.0e7 # No aperture
-        
-    # Angle for astigmatism
-    # C++: ang = acos((kx*kx + k_square - ky*ky) / (2*kx*k)) which simplifies to atan2(ky, kx) logic
-    # but C++ handles quadrants manually. np.arctan2 is safer.
-    # Note: C++ code has `if (ky < 0.0) ang = -ang;`
-    PHI = np.arctan2(KY, KX)
     
     # Aberration function (Chi / Kai)
     # All parameters need to be in consistent units.
@@ -108,20 +202,14 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
     # 0.25 * Cs3 * k^4 * lambda^4
     # This matches standard theory if k is spatial frequency (1/d).
     
-    wal = wavelength_A
-    wal2 = wal**2
-    wal3 = wal**3
-    
-    term_defocus = 0.5 * defocus_A * K2 * wal2
-    term_cs3 = 0.25 * cs3_A * (K2**2) * (wal2**2)
-    term_cs5 = 0.16667 * cs5_A * (K2**3) * (wal3**2)
-    
-    term_a2 = 0.5 * a2_A * K2 * wal2 * np.cos(2.0 * (PHI - a2_angle_rad))
-    term_b2 = 0.3333 * b2_A * K2 * K * wal3 * np.cos(PHI - b2_angle_rad)
-    term_a3 = 0.3333 * a3_A * K2 * K * wal3 * np.cos(3.0 * (PHI - a3_angle_rad))
-    
-    kai = (term_defocus + term_cs3 + term_cs5 + term_a2 + term_b2 + term_a3)
-    kai = kai * 2.0 * np.pi / wal
+    # Per-term coefficients (k-independent parts of each term)
+    c_def = 0.5 * defocus_A * wal2
+    c_cs3 = 0.25 * cs3_A * (wal2**2)
+    c_cs5 = 0.16667 * cs5_A * (wal3**2)
+    c_a2 = 0.5 * a2_A * wal2
+    c_b2 = 0.3333 * b2_A * wal3
+    c_a3 = 0.3333 * a3_A * wal3
+    scale = 2.0 * np.pi / wal
     
     # Envelope Functions
     # Spatial Coherence (Es)
@@ -139,9 +227,6 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
     # Wait, `Es1*k_square`? Usually it's `Cs*lambda^2*k^2`.
     # Let's stick to the C++ implementation exactly.
     
-    Es_exponent = -K2 * (es1 * K2 + es3)**2
-    Es = np.exp(Es_exponent)
-    
     # Chromatic Coherence (Ecc)
     # Ec = -0.5 * pi^2 * wal2 * focalSpread^2
     # Ecc = exp(Ec * k_square^2) ... wait C++ says:
@@ -149,23 +234,143 @@ def calculate_ctf(shape, pixel_size_nm, voltage_kv,
     # focalSpread is in nm -> convert to A: * 10
     focal_spread_A = focal_spread_nm * 10.0
     Ec = -0.5 * (np.pi**2) * wal2 * (focal_spread_A**2)
-    Ecc = np.exp(Ec * (K2**2))
     
-    Envelope = Es * Ecc
+    if _HAS_NUMBA:
+        # One fused pass per pixel: phase, envelopes, CTF and aperture
+        ky = np.fft.fftfreq(ny, d=pixel_size_A)
+        kx = np.fft.fftfreq(nx, d=pixel_size_A)
+        CTF = np.empty((n_defocus, ny, nx), dtype=np.complex64)
+        for d in range(n_defocus):
+            _ctf_kernel(kx, ky, float(c_def[d, 0, 0]), c_cs3, c_cs5,
+                        c_a2, float(a2_angle_rad), c_b2, float(b2_angle_rad),
+                        c_a3, float(a3_angle_rad), scale,
+                        es1, float(es3[d, 0, 0]), Ec, kmax2, CTF[d])
+        return CTF
+    
+    K2, K, PHI = _ctf_grid(int(ny), int(nx), float(pixel_size_A))
+    
+    # Accumulate the terms into one (D, ny, nx) buffer; tmp holds each
+    # defocus-independent (ny, nx) term in turn.
+    # Terms with a zero coefficient (the default for Cs5, astigmatism and
+    # coma) contribute nothing and are skipped.
+    kai = np.multiply(K2, c_def.astype(np.float32))             # defocus
+    K4 = np.square(K2)
+    tmp = np.multiply(K4, c_cs3)                                # Cs3
+    kai += tmp
+    if c_cs5 != 0.0:
+        np.multiply(K4, K2, out=tmp)
+        tmp *= c_cs5                                            # Cs5
+        kai += tmp
+    
+    if c_a2 != 0.0:
+        np.subtract(PHI, a2_angle_rad, out=tmp)                 # A2
+        tmp *= 2.0
+        np.cos(tmp, out=tmp)
+        tmp *= K2
+        tmp *= c_a2
+        kai += tmp
+    
+    if c_b2 != 0.0 or c_a3 != 0.0:
+        K3 = np.multiply(K2, K)
+    if c_b2 != 0.0:
+        np.subtract(PHI, b2_angle_rad, out=tmp)                 # B2
+        np.cos(tmp, out=tmp)
+        tmp *= K3
+        tmp *= c_b2
+        kai += tmp
+    
+    if c_a3 != 0.0:
+        np.subtract(PHI, a3_angle_rad, out=tmp)                 # A3
+        tmp *= 3.0
+        np.cos(tmp, out=tmp)
+        tmp *= K3
+        tmp *= c_a3
+        kai += tmp
+    
+    kai *= scale
+    
+    # Envelopes are identically 1 without convergence / focal spread
+    Envelope = None
+    if es1 != 0.0 or np.any(es3 != 0.0):
+        Es = np.multiply(K2, es1, out=np.empty_like(kai))
+        Es += es3.astype(np.float32)
+        np.square(Es, out=Es)
+        Es *= K2
+        np.negative(Es, out=Es)
+        np.exp(Es, out=Es)
+        Envelope = Es
+    
+    if Ec != 0.0:
+        Ecc = np.multiply(K4, Ec, out=K4)
+        np.exp(Ecc, out=Ecc)
+        if Envelope is None:
+            Envelope = Ecc
+        else:
+            np.multiply(Envelope, Ecc, out=Envelope)
     
     # CTF
     # C++: CTF[index][0] = Esc * cosf(kai);
     #      CTF[index][1] = -Esc * sinf(kai);
     # So CTF = Envelope * (cos(kai) - i * sin(kai)) = Envelope * exp(-i * kai)
     
-    CTF = Envelope * np.exp(-1j * kai)
-    
-    # Apply Aperture
-    mask = K2 < kmax2
-    CTF = CTF * mask
+    # Written as real/imaginary views of a complex64 array
+    CTF = np.empty(kai.shape, dtype=np.complex64)
+    re, im = CTF.real, CTF.imag
+    np.cos(kai, out=re)
+    np.sin(kai, out=im)
+    np.negative(im, out=im)
+    if Envelope is not None:
+        np.multiply(re, Envelope, out=re)
+        np.multiply(im, Envelope, out=im)
+    
+    # Apply Aperture: clear the pixels outside it in place rather than
+    # multiplying the whole complex array by the mask
+    outside = K2 >= kmax2
+    CTF[:, outside] = 0
     
     return CTF
 
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ctf_kernel(kx, ky, c_def, c_cs3, c_cs5,
+                    c_a2, a2_ang, c_b2, b2_ang, c_a3, a3_ang, scale,
+                    es1, es3, Ec, kmax2, out):
+        """Fused calculate_ctf kernel; writes the aperture-masked CTF into out."""
+        ny = ky.shape[0]
+        nx = kx.shape[0]
+        # Zero-amplitude terms are skipped per pixel
+        angular = c_a2 != 0.0 or c_b2 != 0.0 or c_a3 != 0.0
+        spatial = es1 != 0.0 or es3 != 0.0
+        for i in prange(ny):
+            kyi = ky[i]
+            for j in range(nx):
+                kxj = kx[j]
+                k2 = kxj * kxj + kyi * kyi
+                if k2 >= kmax2:
+                    out[i, j] = 0.0
+                    continue
+                k4 = k2 * k2
+                kai = c_def * k2 + c_cs3 * k4
+                if c_cs5 != 0.0:
+                    kai += c_cs5 * k4 * k2
+                if angular:
+                    k = math.sqrt(k2)
+                    phi = math.atan2(kyi, kxj)
+                    if c_a2 != 0.0:
+                        kai += c_a2 * k2 * math.cos(2.0 * (phi - a2_ang))
+                    if c_b2 != 0.0:
+                        kai += c_b2 * k2 * k * math.cos(phi - b2_ang)
+                    if c_a3 != 0.0:
+                        kai += c_a3 * k2 * k * math.cos(3.0 * (phi - a3_ang))
+                kai *= scale
+                env = 1.0
+                if spatial:
+                    t = es1 * k2 + es3
+                    env = math.exp(-k2 * t * t)
+                if Ec != 0.0:
+                    env *= math.exp(Ec * k4)
+                out[i, j] = complex(env * math.cos(kai), -env * math.sin(kai))
+
 def calculate_probe(ctf, xp=0, yp=0):
     """
     Calculate the Probe function from the CTF.
@@ -177,7 +382,7 @@ def calculate_probe(ctf, xp=0, yp=0):
         yp (float): Probe position y (unused in C++ due to cos(90)=0).
         
     Returns:
-        np.ndarray: Complex Probe.
+        np.ndarray: Probe intensity |Psi|^2 (real, float32).
     """
     # C++: 
     # k = (kx * xp + ky * yp + kx * yp + ky * xp) * cosf(90.0f * pi / 180.0f);
@@ -192,11 +397,11 @@ def calculate_probe(ctf, xp=0, yp=0):
     # Note: The CTF generated by calculate_ctf has zero frequency at corners (standard FFT layout).
     # So we can directly apply IFFT.
     
+    # Multithreaded utils backend (pyFFTW when installed); the CTF itself is
+    # left untouched since callers keep it alongside the probe
+    ctf = np.ascontiguousarray(ctf, dtype=np.complex64)
     probe = ifft2(ctf)
     
-    # C++ Rearrange puts zero frequency at center.
-    probe = fftshift(probe)
-    
     # Effective Probe Calculation (Intensity)
     # C++:
     # for (int i = 0; i < N; ++i)
@@ -207,10 +412,32 @@ def calculate_probe(ctf, xp=0, yp=0):
     # This means the probe used for deconvolution is actually the intensity |Psi|^2,
     # and the imaginary part is set to 0.
     
-    probe_intensity = np.abs(probe)**2
-    # Return as complex array with 0 imaginary part to match C++ structure if needed,
-    # or just real array since imaginary part is explicitly 0.
-    # The deconvolution functions cast to complex64 anyway.
+    # re^2 + im^2 (no sqrt, no temporaries), accumulated in the real part
+    # of our own IFFT output
+    re, im = probe.real, probe.imag
+    np.square(re, out=re)
+    np.square(im, out=im)
+    re += im
     
-    return probe_intensity.astype(np.complex64)
+    # C++ Rearrange puts zero frequency at center.
+    # |fftshift(psi)|^2 == fftshift(|psi|^2), so the shift is applied while
+    # copying the intensity into the float32 result rather than as a
+    # separate fftshift of the complex probe.
+    probe_intensity = np.empty(probe.shape, dtype=np.float32)
+    _fftshift_into(re, probe_intensity)
+    # The imaginary part is identically zero, so the intensity is returned
+    # as a real array; the deconvolution works on it with rfft2.
+    
+    return probe_intensity
 
+def _fftshift_into(src, out):
+    """
+    Write fftshift(src) into the preallocated 2D array out (four block copies).
+    """
+    ny, nx = src.shape
+    sy, sx = ny // 2, nx // 2
+    out[sy:, sx:] = src[:ny - sy, :nx - sx]
+    out[sy:, :sx] = src[:ny - sy, nx - sx:]
+    out[:sy, sx:] = src[ny - sy:, :nx - sx]
+    out[:sy, :sx] = src[ny - sy:, nx - sx:]
+    return out
@@ -1,12 +1,22 @@
+import math
+
 import numpy as np
 from scipy.ndimage import convolve1d
 
+# numba is optional; without it the stencils fall back to numpy/scipy
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 def total_variation_gradient(image):
     """
     Calculate the curvature term for Total Variation (TV) regularization.
     Returns div(grad(u)/|grad(u)|) using stable forward/backward differences.
     """
-    epsilon = 1e-8
+    # float32 so single-precision input stays single precision
+    epsilon = np.float32(1e-8)
     
     def get_curvature(data):
         # Forward differences
@@ -29,6 +39,16 @@ def total_variation_gradient(image):
         
         return div_x + div_y
 
+    if _HAS_NUMBA:
+        # One fused pass per component, written straight into the result
+        out = np.empty(image.shape, dtype=np.result_type(image, np.float32))
+        if np.iscomplexobj(image):
+            _tv_curvature_kernel(image.real, epsilon, out.real)
+            _tv_curvature_kernel(image.imag, epsilon, out.imag)
+        else:
+            _tv_curvature_kernel(image, epsilon, out)
+        return out
+
     if np.iscomplexobj(image):
         curv_r = get_curvature(image.real)
         curv_i = get_curvature(image.imag)
@@ -36,7 +56,52 @@ def total_variation_gradient(image):
     else:
         return get_curvature(image)
 
-def tikhonov_miller_regularization(image, lambda_reg, pixel_size, wavelength):
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _tv_curvature_kernel(u, epsilon, out):
+        """Fused get_curvature kernel with periodic boundaries."""
+        rows, cols = u.shape
+        for i in prange(rows):
+            ip = i + 1 if i < rows - 1 else 0
+            im = i - 1 if i > 0 else rows - 1
+            for j in range(cols):
+                jp = j + 1 if j < cols - 1 else 0
+                jm = j - 1 if j > 0 else cols - 1
+                c = u[i, j]
+                # Normalized gradient at (i, j)
+                dx = u[i, jp] - c
+                dy = u[ip, j] - c
+                norm = math.sqrt(dx * dx + dy * dy + epsilon)
+                nx = dx / norm
+                ny = dy / norm
+                # nx at (i, j-1)
+                dx = c - u[i, jm]
+                dy = u[ip, jm] - u[i, jm]
+                nx_left = dx / math.sqrt(dx * dx + dy * dy + epsilon)
+                # ny at (i-1, j)
+                dx = u[im, jp] - u[im, j]
+                dy = c - u[im, j]
+                ny_up = dy / math.sqrt(dx * dx + dy * dy + epsilon)
+                out[i, j] = (nx - nx_left) + (ny - ny_up)
+
+# Coefficients for 9-point stencil (First Derivative)
+_TM_F0 = 4.0 / 5.0
+_TM_F1 = -1.0 / 5.0
+_TM_F2 = 8.0 / 210.0
+_TM_F3 = -1.0 / 280.0
+
+# Kernel construction for convolution
+# We want f0*(x[i+1] - x[i-1]) + ...
+# Convolution: sum k[j] * x[i-j]
+# For x[i+1] (j=-1), we need k[-1] = f0.
+# For x[i-1] (j=1), we need k[1] = -f0.
+# Kernel indices: [-4, -3, -2, -1, 0, 1, 2, 3, 4]
+# Values: [f3, f2, f1, f0, 0, -f0, -f1, -f2, -f3]
+_TM_WEIGHTS = np.array([_TM_F3, _TM_F2, _TM_F1, _TM_F0, 0,
+                        -_TM_F0, -_TM_F1, -_TM_F2, -_TM_F3], dtype=np.float32)
+_TM_WEIGHTS.setflags(write=False)
+
+def tikhonov_miller_regularization(image, lambda_reg, pixel_size, wavelength, out=None):
     """
     Calculate the Tikhonov-Miller regularization term.
     Strictly follows C++ implementation: 1 - 2 * lambda * (FirstDerivativeSum) * scal
@@ -46,37 +111,44 @@ def tikhonov_miller_regularization(image, lambda_reg, pixel_size, wavelength):
         lambda_reg (float): Regularization parameter.
         pixel_size (float): Pixel size in Angstrom (or nm, must match wavelength units).
         wavelength (float): Wavelength in Angstrom (or nm).
+        out (np.ndarray, optional): Buffer of the result's shape and dtype to
+            write into, so iterative callers can reuse one allocation.
         
     Returns:
         np.ndarray: The regularization term (denominator for Multiplicative RL).
     """
-    # Coefficients for 9-point stencil (First Derivative)
-    f0 = 4.0 / 5.0
-    f1 = -1.0 / 5.0
-    f2 = 8.0 / 210.0
-    f3 = -1.0 / 280.0
+    if out is None:
+        out = np.empty(image.shape, dtype=np.result_type(image, np.float32))
+    
+    # Scalars in the result's precision, so float32 stays float32
+    real = out.real.dtype.type
     
-    # Kernel construction for convolution
-    # We want f0*(x[i+1] - x[i-1]) + ...
-    # Convolution: sum k[j] * x[i-j]
-    # For x[i+1] (j=-1), we need k[-1] = f0.
-    # For x[i-1] (j=1), we need k[1] = -f0.
-    # Kernel indices: [-4, -3, -2, -1, 0, 1, 2, 3, 4]
-    # Values: [f3, f2, f1, f0, 0, -f0, -f1, -f2, -f3]
-    weights = np.array([f3, f2, f1, f0, 0, -f0, -f1, -f2, -f3], dtype=np.float32)
+    # C++ passes pixel_size^2 as dx/dy; reciprocals avoid per-pixel divides
+    inv_dx = real(1.0 / (pixel_size * pixel_size + 1e-16)) # Avoid div by zero
+    inv_dy = inv_dx
     
-    # C++ passes pixel_size^2 as dx/dy
-    dx = pixel_size * pixel_size + 1e-16 # Avoid div by zero
-    dy = pixel_size * pixel_size + 1e-16
+    scal_ = real(wavelength / (4.0 * np.pi))
     
-    scal_ = wavelength / (4.0 * np.pi)
+    if _HAS_NUMBA:
+        # Fused x + y stencil and 1 - 2*lambda*term in one pass per component
+        c2 = real(2.0 * lambda_reg)
+        if np.iscomplexobj(image):
+            _tm_kernel(image.real, inv_dx, inv_dy, scal_, c2, real(1.0 + 1e-16), out.real)
+            _tm_kernel(image.imag, inv_dx, inv_dy, scal_, c2, real(0.0), out.imag)
+        else:
+            _tm_kernel(image, inv_dx, inv_dy, scal_, c2, real(1.0 + 1e-16), out)
+        return out
     
     def get_diff_sum(data):
         # Convolve along axis 1 (x) and axis 0 (y)
         # mode='wrap' for periodic boundary conditions
-        diff_x = convolve1d(data, weights, axis=1, mode='wrap') / dx
-        diff_y = convolve1d(data, weights, axis=0, mode='wrap') / dy
-        return (diff_x + diff_y) * scal_
+        diff_x = convolve1d(data, _TM_WEIGHTS, axis=1, mode='wrap', output=out.real.dtype)
+        diff_x *= inv_dx
+        diff_y = convolve1d(data, _TM_WEIGHTS, axis=0, mode='wrap', output=out.real.dtype)
+        diff_y *= inv_dy
+        diff_x += diff_y
+        diff_x *= scal_
+        return diff_x
 
     if np.iscomplexobj(image):
         term_r = get_diff_sum(image.real)
@@ -86,6 +158,38 @@ def tikhonov_miller_regularization(image, lambda_reg, pixel_size, wavelength):
         term = get_diff_sum(image)
         
     # C++: out = 1 - 2 * lambda * out
-    return 1.0 - 2.0 * lambda_reg * term + 1e-16
+    np.multiply(term, -2.0 * lambda_reg, out=out)
+    out += 1.0 + 1e-16
+    return out
 
+if _HAS_NUMBA:
+    # Stencil coefficients f0..f3 as stored in _TM_WEIGHTS (float32 scalars,
+    # so numba keeps float32 input in single precision)
+    _TM_C0, _TM_C1, _TM_C2, _TM_C3 = _TM_WEIGHTS[3::-1]
 
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _tm_kernel(a, inv_dx, inv_dy, scal, c2, offset, out):
+        """
+        Fused 9-point x + y derivative with periodic boundaries;
+        writes offset - c2 * (sum_x / dx + sum_y / dy) * scal into out.
+        """
+        rows, cols = a.shape
+        for i in prange(rows):
+            i1p = (i + 1) % rows
+            i1m = (i - 1) % rows
+            i2p = (i + 2) % rows
+            i2m = (i - 2) % rows
+            i3p = (i + 3) % rows
+            i3m = (i - 3) % rows
+            i4p = (i + 4) % rows
+            i4m = (i - 4) % rows
+            for j in range(cols):
+                sum_x = (_TM_C0 * (a[i, (j + 1) % cols] - a[i, (j - 1) % cols])
+                         + _TM_C1 * (a[i, (j + 2) % cols] - a[i, (j - 2) % cols])
+                         + _TM_C2 * (a[i, (j + 3) % cols] - a[i, (j - 3) % cols])
+                         + _TM_C3 * (a[i, (j + 4) % cols] - a[i, (j - 4) % cols]))
+                sum_y = (_TM_C0 * (a[i1p, j] - a[i1m, j])
+                         + _TM_C1 * (a[i2p, j] - a[i2m, j])
+                         + _TM_C2 * (a[i3p, j] - a[i3m, j])
+                         + _TM_C3 * (a[i4p, j] - a[i4m, j]))
+                out[i, j] = offset - c2 * ((sum_x * inv_dx + sum_y * inv_dy) * scal)
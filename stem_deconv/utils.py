@@ -1,7 +1,87 @@
+import atexit
+import os
+import struct
+
 import numpy as np
 import mrcfile
 import scipy.fft
 
+# pyFFTW is optional; with it the FFT wrappers reuse cached FFTW plans
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as _fftw_fft
+    _HAS_PYFFTW = True
+except ImportError:
+    _HAS_PYFFTW = False
+
+if _HAS_PYFFTW:
+    # Keep plans alive between calls; the filters and RL loops repeat
+    # transforms on identically shaped buffers
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    _fft_backend = _fftw_fft
+    _fft_kwargs = {'planner_effort': 'FFTW_MEASURE'}
+else:
+    _fft_backend = scipy.fft
+    _fft_kwargs = {}
+
+# Optional wisdom file so FFTW_MEASURE plans persist across runs
+_WISDOM_PATH = os.environ.get('STEM_DECONV_FFTW_WISDOM')
+
+# Each wisdom entry is stored as a little-endian uint64 length + raw bytes
+_WISDOM_LEN = struct.Struct('<Q')
+
+def _encode_wisdom(wisdom):
+    """
+    Pack the tuple of bytes returned by pyfftw.export_wisdom.
+    """
+    return b''.join(_WISDOM_LEN.pack(len(w)) + bytes(w) for w in wisdom)
+
+def _decode_wisdom(data):
+    """
+    Inverse of _encode_wisdom.
+    Raises:
+        ValueError: If data is truncated.
+    """
+    wisdom = []
+    pos = 0
+    while pos < len(data):
+        if pos + _WISDOM_LEN.size > len(data):
+            raise ValueError("Truncated FFTW wisdom length")
+        (n,) = _WISDOM_LEN.unpack_from(data, pos)
+        pos += _WISDOM_LEN.size
+        if pos + n > len(data):
+            raise ValueError("Truncated FFTW wisdom entry")
+        wisdom.append(bytes(data[pos:pos + n]))
+        pos += n
+    return tuple(wisdom)
+
+def _load_wisdom(path):
+    """
+    Import FFTW wisdom saved by _save_wisdom; a missing or malformed file
+    is ignored.
+    """
+    try:
+        with open(path, 'rb') as f:
+            wisdom = _decode_wisdom(f.read())
+        pyfftw.import_wisdom(wisdom)
+    except (OSError, ValueError, TypeError):
+        pass
+
+def _save_wisdom(path):
+    """
+    Export the accumulated FFTW wisdom (registered with atexit).
+    """
+    try:
+        with open(path, 'wb') as f:
+            f.write(_encode_wisdom(pyfftw.export_wisdom()))
+    except OSError:
+        pass
+
+if _HAS_PYFFTW and _WISDOM_PATH:
+    _load_wisdom(_WISDOM_PATH)
+    atexit.register(_save_wisdom, _WISDOM_PATH)
+
 def read_mrc(filepath):
     """
     Read an MRC file.
@@ -29,17 +109,31 @@ def write_mrc(filepath, data, pixel_size):
         # Convert nm back to Angstroms for storage
         mrc.voxel_size = pixel_size * 10.0
 
-def fft2(data):
+def fft2(data, overwrite_x=False):
+    """
+    Compute the 2-D discrete Fourier Transform (multithreaded).
+    Pass overwrite_x=True only when data is a scratch buffer.
+    """
+    return _fft_backend.fft2(data, workers=-1, overwrite_x=overwrite_x, **_fft_kwargs)
+
+def ifft2(data, overwrite_x=False):
+    """
+    Compute the 2-D inverse discrete Fourier Transform (multithreaded).
+    Pass overwrite_x=True only when data is a scratch buffer.
+    """
+    return _fft_backend.ifft2(data, workers=-1, overwrite_x=overwrite_x, **_fft_kwargs)
+
+def rfft2(data):
     """
-    Compute the 2-D discrete Fourier Transform.
+    Compute the 2-D discrete Fourier Transform of real input (half plane).
     """
-    return scipy.fft.fft2(data)
+    return _fft_backend.rfft2(data, workers=-1, **_fft_kwargs)
 
-def ifft2(data):
+def irfft2(data, s=None):
     """
-    Compute the 2-D inverse discrete Fourier Transform.
+    Compute the inverse of rfft2; s gives the real output shape.
     """
-    return scipy.fft.ifft2(data)
+    return _fft_backend.irfft2(data, s=s, workers=-1, **_fft_kwargs)
 
 def fftshift(data):
     """
@@ -0,0 +1,48 @@
+import logging
+import os
+import tempfile
+import unittest
+
+import mrcfile
+import numpy as np
+
+from stem_deconv.io import batch_load_mrc
+
+
+class TestBatchLoadMrc(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for k in range(3):
+            path = os.path.join(self._tmp.name, f'img{k}.mrc')
+            with mrcfile.new(path) as mrc:
+                mrc.set_data(np.arange(48, dtype=np.float32).reshape(6, 8) + k)
+                mrc.voxel_size = 1.0
+            self.files.append(path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_prefetch_false(self):
+        results = batch_load_mrc(self.files, prefetch=False)
+        self.assertEqual(list(results), self.files)
+        for data, pixel_size in results.values():
+            self.assertEqual(data.shape, (6, 8))
+
+    def test_unknown_kwarg_fails_per_file(self):
+        with self.assertLogs('stem_deconv.io', level=logging.ERROR) as logs:
+            results = batch_load_mrc(self.files, no_such_option=1)
+        self.assertEqual(results, {})
+        failed = [msg for msg in logs.output if 'Failed to load' in msg]
+        self.assertEqual(len(failed), len(self.files))
+
+    def test_missing_file_lands_in_failed(self):
+        missing = os.path.join(self._tmp.name, 'missing.mrc')
+        with self.assertLogs('stem_deconv.io', level=logging.ERROR) as logs:
+            results = batch_load_mrc(self.files + [missing])
+        self.assertEqual(list(results), self.files)
+        self.assertTrue(any(missing in msg for msg in logs.output))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from stem_deconv.utils import _encode_wisdom, _decode_wisdom, _load_wisdom
+
+# Shaped like pyfftw.export_wisdom(): (double, single, long double) wisdom
+WISDOM = (
+    b'(fftw-3.3.10 fftw_wisdom #x4be12fff\n  (fftw_rdft2_rank_geq2_register 0 #x10048)\n)\n',
+    b'',
+    b'\x00binary\xffbytes\n',
+)
+
+
+class TestWisdomFormat(unittest.TestCase):
+    def test_round_trip(self):
+        self.assertEqual(_decode_wisdom(_encode_wisdom(WISDOM)), WISDOM)
+        self.assertEqual(_decode_wisdom(_encode_wisdom(())), ())
+
+    def test_round_trip_through_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'wisdom.bin')
+            with open(path, 'wb') as f:
+                f.write(_encode_wisdom(WISDOM))
+            with open(path, 'rb') as f:
+                self.assertEqual(_decode_wisdom(f.read()), WISDOM)
+
+    def test_truncated_data_is_rejected(self):
+        data = _encode_wisdom(WISDOM)
+        with self.assertRaises(ValueError):
+            _decode_wisdom(data[:-1])
+        with self.assertRaises(ValueError):
+            _decode_wisdom(data[:4])
+
+    def test_malformed_or_missing_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'wisdom.bin')
+            with open(path, 'wb') as f:
+                f.write(b'\xff' * 12)
+            _load_wisdom(path)
+            _load_wisdom(os.path.join(tmp, 'missing.bin'))
+
+
+if __name__ == '__main__':
+    unittest.main()